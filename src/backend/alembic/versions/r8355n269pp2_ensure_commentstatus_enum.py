@@ -9,11 +9,11 @@ exist with all required values. These enums were previously only created by
 SQLAlchemy's create_all() for fresh databases, or by migrations that used
 checkfirst=True which skips creation if enum exists but doesn't add missing values.
 """
+import re
 from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -22,33 +22,38 @@ down_revision: Union[str, None] = '5845de034cb6'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# PostgreSQL cannot bind parameters in CREATE TYPE / ALTER TYPE .. ADD VALUE,
+# so enum names and values are interpolated into the SQL. Restrict them to a
+# strict lowercase-identifier shape so nothing quote-breaking can slip in.
+_SAFE_ENUM_TOKEN = re.compile(r'^[a-z_][a-z0-9_]*$')
+
 
 def ensure_enum_values(conn, enum_name: str, required_values: list[str]) -> None:
-    """Ensure a PostgreSQL enum type exists with all required values."""
-    # Check if the enum type exists
+    """Ensure a PostgreSQL enum type exists with all required values.
+
+    ALTER TYPE .. ADD VALUE IF NOT EXISTS is already idempotent, so there is
+    no need to pre-read pg_enum: one existence check on pg_type decides
+    between CREATE TYPE and a direct ALTER per required value.
+    """
+    for token in [enum_name, *required_values]:
+        if not _SAFE_ENUM_TOKEN.match(token):
+            raise ValueError(f"Unsafe enum identifier: {token!r}")
+
     result = conn.execute(sa.text(
         "SELECT 1 FROM pg_type WHERE typname = :enum_name"
     ), {"enum_name": enum_name})
-    enum_exists = result.scalar() is not None
-    
-    if not enum_exists:
+
+    if result.scalar() is None:
         # Create the enum type with all values
         values_str = ", ".join(f"'{v}'" for v in required_values)
         conn.execute(sa.text(f"CREATE TYPE {enum_name} AS ENUM ({values_str})"))
-    else:
-        # Enum exists, ensure all required values are present
-        result = conn.execute(sa.text("""
-            SELECT enumlabel FROM pg_enum 
-            WHERE enumtypid = (SELECT oid FROM pg_type WHERE typname = :enum_name)
-        """), {"enum_name": enum_name})
-        existing_values = {row[0] for row in result}
-        
-        # Add missing values (PostgreSQL 9.1+ supports ADD VALUE IF NOT EXISTS)
-        for value in required_values:
-            if value not in existing_values:
-                conn.execute(sa.text(
-                    f"ALTER TYPE {enum_name} ADD VALUE IF NOT EXISTS '{value}'"
-                ))
+        return
+
+    # Enum exists: idempotent ALTER per value (PostgreSQL 9.1+)
+    for value in required_values:
+        conn.execute(sa.text(
+            f"ALTER TYPE {enum_name} ADD VALUE IF NOT EXISTS '{value}'"
+        ))
 
 
 def upgrade() -> None:
@@ -104,6 +104,10 @@ class Settings(BaseSettings):
     enabled_jobs: List[str] = Field(default_factory=list)
     updated_at: Optional[datetime] = None
 
+    # Max tool calls dispatched concurrently per MCP request (batch fan-out cap)
+    # Protects the DB pool and downstream APIs from unbounded gather() fan-out
+    MCP_MAX_CONCURRENCY: int = Field(16, env='MCP_MAX_CONCURRENCY')
+
     # Demo Mode Flag
     APP_DEMO_MODE: bool = Field(False, env='APP_DEMO_MODE')
 
@@ -200,20 +200,20 @@ class MCPTokensManager:
         
         return False
     
-    def revoke_token(self, token_id: UUID) -> bool:
+    def revoke_token(self, token_id: UUID) -> Optional[str]:
         """
         Revoke a token, making it inactive.
-        
+
         Args:
             token_id: The ID of the token to revoke
-            
+
         Returns:
-            True if the token was found and revoked
+            The revoked token's name, or None if no active token matched
         """
-        success = mcp_tokens_repo.revoke(self._db, token_id)
-        if success:
+        name = mcp_tokens_repo.revoke(self._db, token_id)
+        if name is not None:
             logger.info(f"Revoked MCP token: id={token_id}")
-        return success
+        return name
     
     def list_tokens(self, include_inactive: bool = False) -> List[MCPTokenDb]:
         """
@@ -234,18 +234,18 @@ class MCPTokensManager:
         """Get a token by ID."""
         return mcp_tokens_repo.get_by_id(self._db, token_id)
     
-    def delete_token(self, token_id: UUID) -> bool:
+    def delete_token(self, token_id: UUID) -> Optional[str]:
         """
         Permanently delete a token.
-        
+
         Args:
             token_id: The ID of the token to delete
-            
+
         Returns:
-            True if the token was found and deleted
+            The deleted token's name, or None if the token was not found
         """
-        success = mcp_tokens_repo.delete(self._db, token_id)
-        if success:
+        name = mcp_tokens_repo.delete(self._db, token_id)
+        if name is not None:
             logger.info(f"Deleted MCP token: id={token_id}")
-        return success
+        return name
 
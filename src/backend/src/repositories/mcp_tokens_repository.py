@@ -8,7 +8,7 @@ from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, update
 from sqlalchemy.orm import Session
 
 from src.common.logging import get_logger
@@ -109,29 +109,42 @@ class MCPTokensRepository:
             {"last_used_at": datetime.now(timezone.utc)}
         )
     
-    def revoke(self, db: Session, token_id: UUID) -> bool:
+    def revoke(self, db: Session, token_id: UUID) -> Optional[str]:
         """
         Revoke a token by setting is_active to False.
-        
+
+        Runs a single UPDATE .. RETURNING so callers learn existence (and get
+        the token name for audit logging) without a prior SELECT, and without
+        a SELECT/UPDATE race. Already-revoked tokens don't match.
+
         Returns:
-            True if the token was found and revoked, False otherwise
+            The token's name if an active token was found and revoked, else None
         """
-        result = db.query(MCPTokenDb).filter(MCPTokenDb.id == token_id).update(
-            {"is_active": False}
-        )
+        row = db.execute(
+            update(MCPTokenDb)
+            .where(and_(MCPTokenDb.id == token_id, MCPTokenDb.is_active == True))
+            .values(is_active=False)
+            .returning(MCPTokenDb.name)
+        ).first()
         db.flush()
-        return result > 0
-    
-    def delete(self, db: Session, token_id: UUID) -> bool:
+        return row[0] if row else None
+
+    def delete(self, db: Session, token_id: UUID) -> Optional[str]:
         """
         Permanently delete a token.
-        
+
+        Single DELETE .. RETURNING — see revoke() for rationale.
+
         Returns:
-            True if the token was found and deleted, False otherwise
+            The token's name if the token was found and deleted, else None
         """
-        result = db.query(MCPTokenDb).filter(MCPTokenDb.id == token_id).delete()
+        row = db.execute(
+            delete(MCPTokenDb)
+            .where(MCPTokenDb.id == token_id)
+            .returning(MCPTokenDb.name)
+        ).first()
         db.flush()
-        return result > 0
+        return row[0] if row else None
 
 
 # Singleton instance
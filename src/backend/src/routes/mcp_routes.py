@@ -6,15 +6,22 @@ Supports both standard HTTP POST/JSON responses and SSE (Server-Sent Events) tra
 """
 
 import asyncio
+import hashlib
 import json
 import secrets
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, timezone
 from typing import Any, AsyncGenerator, Dict, List, Optional, Union
 
+import orjson
 from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from sse_starlette.sse import EventSourceResponse
+from starlette.concurrency import run_in_threadpool
 
 from src.common.config import Settings, get_settings
 from src.common.database import get_db
@@ -22,9 +29,9 @@ from src.common.dependencies import AuditManagerDep
 from src.common.logging import get_logger
 from src.controller.audit_manager import AuditManager
 from src.controller.mcp_tokens_manager import MCPTokensManager, MCPTokenInfo
-from src.models.mcp import JSONRPCRequest, JSONRPCError, JSONRPCResponse
+from src.models.mcp import JSONRPCRequest
 from src.tools.base import ToolContext, ToolResult
-from src.tools.registry import create_default_registry
+from src.tools.registry import ToolRegistry, create_default_registry
 
 logger = get_logger(__name__)
 
@@ -56,26 +63,123 @@ MCP_FEATURE_ID = "mcp"
 # Session storage (in-memory for now, could be moved to Redis/DB for production)
 _sessions: Dict[str, Dict[str, Any]] = {}
 
+# Short-TTL LRU cache for validated tokens. Token validation is a DB
+# round-trip plus a bcrypt compare per active token, repeated with the same
+# API key on every MCP call — cache the result briefly so a busy agent pays
+# it once per TTL window instead of per request. Keys are blake2b digests so
+# plaintext API keys are never held in memory. Mutations (revoke/delete) must
+# call invalidate_token_cache(). Validation misses run in threadpool workers
+# (see validate_api_key_async), so every access goes through _TOKEN_CACHE_LOCK.
+_TOKEN_CACHE: "OrderedDict[bytes, tuple[float, MCPTokenInfo]]" = OrderedDict()
+_TOKEN_CACHE_LOCK = threading.Lock()
+_TOKEN_CACHE_TTL_SECONDS = 30.0
+_TOKEN_CACHE_MAX_SIZE = 256
+
+
+# Ping timestamp cached at 1-second resolution: [epoch_second, iso_string].
+# Mutated only from the event loop, so no locking is needed.
+_PING_TS: List[Any] = [0, ""]
+
+# Encoder options for serializing tool results. OPT_NON_STR_KEYS lets tool
+# data use UUID/int dict keys without a Python-level fallback per key;
+# OPT_NAIVE_UTC pins naive datetimes from the DB to UTC so clients see
+# consistent timestamps. default=str still covers anything orjson cannot
+# encode natively, but on this path it fires far less often than it did
+# with stdlib json.
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+
+# tools/list results keyed by token scope set. The output is a pure function
+# of (registry, scope set): the registry is static for the process lifetime
+# and scope sets are small and repeat across tokens, so reconnect-heavy MCP
+# clients hit a prebuilt list instead of re-filtering per request. LRU-capped;
+# cleared by invalidate_registry_caches().
+_TOOLS_LIST_CACHE: "OrderedDict[frozenset, List[Dict[str, Any]]]" = OrderedDict()
+_TOOLS_LIST_CACHE_MAX_SIZE = 128
+
+
+def invalidate_registry_caches() -> None:
+    """
+    Clear the registry and everything derived from it, including the
+    per-scope-set tools/list cache. For tests and any future registry
+    reload event.
+    """
+    _get_registry.cache_clear()
+    _get_mcp_definitions.cache_clear()
+    _get_tool_required_scopes.cache_clear()
+    _TOOLS_LIST_CACHE.clear()
+
+
+def _token_cache_key(x_api_key: str) -> bytes:
+    """Digest of the API key used as the cache key (never the plaintext)."""
+    return hashlib.blake2b(x_api_key.encode('utf-8'), digest_size=16).digest()
+
+
+def invalidate_token_cache() -> None:
+    """
+    Drop all cached token validations.
+
+    Called by the token management routes after revoke/delete so a revoked
+    token stops working immediately rather than at TTL expiry. Clearing the
+    whole cache is broad but cheap — the TTL is short and the cache refills
+    on the next request.
+    """
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE.clear()
+
+
+@lru_cache(maxsize=1)
+def _get_registry() -> ToolRegistry:
+    """
+    Process-wide tool registry.
+
+    The registry is immutable for the process lifetime, so build it once
+    instead of per JSON-RPC request. lru_cache (rather than a bare module
+    global) keeps construction lazy and lets tests clear it via cache_clear().
+    """
+    return create_default_registry()
+
+
+@lru_cache(maxsize=1)
+def _get_mcp_definitions() -> List[Dict[str, Any]]:
+    """Prebuilt MCP tool definitions from the shared registry."""
+    return _get_registry().get_mcp_definitions()
+
+
+@lru_cache(maxsize=1)
+def _get_tool_required_scopes() -> Dict[str, Optional[str]]:
+    """Map of tool name -> required scope, precomputed from the registry."""
+    registry = _get_registry()
+    return {
+        d["name"]: getattr(registry.get(d["name"]), "required_scope", "*")
+        for d in _get_mcp_definitions()
+    }
+
+
+# Responses are built as plain dicts rather than Pydantic models: the hot
+# path only ever serializes them back out, so the model construction +
+# model_dump() walk is pure overhead. Unset result/error fields are omitted
+# entirely instead of sent as nulls. The Pydantic models in src.models.mcp
+# are kept for validating *incoming* requests.
 
 def make_error_response(
     code: int,
     message: str,
     data: Any = None,
     request_id: Optional[Union[str, int]] = None
-) -> JSONRPCResponse:
-    """Create a JSON-RPC error response."""
-    return JSONRPCResponse(
-        error=JSONRPCError(code=code, message=message, data=data),
-        id=request_id
-    )
+) -> Dict[str, Any]:
+    """Create a JSON-RPC error response dict."""
+    error: Dict[str, Any] = {"code": code, "message": message}
+    if data is not None:
+        error["data"] = data
+    return {"jsonrpc": "2.0", "error": error, "id": request_id}
 
 
 def make_success_response(
     result: Any,
     request_id: Optional[Union[str, int]] = None
-) -> JSONRPCResponse:
-    """Create a JSON-RPC success response."""
-    return JSONRPCResponse(result=result, id=request_id)
+) -> Dict[str, Any]:
+    """Create a JSON-RPC success response dict."""
+    return {"jsonrpc": "2.0", "result": result, "id": request_id}
 
 
 def generate_session_id() -> str:
@@ -127,7 +231,24 @@ class MCPHandler:
         self._request = request
         self._audit_manager = audit_manager
         self._session_id = session_id
-        self._tool_registry = create_default_registry()
+        self._tool_registry = _get_registry()
+        # Precompile scope matching: _has_scope runs for every tools/list
+        # entry and every tools/call, so turn the list scans into set lookups.
+        self._scope_set = set(token_info.scopes or [])
+        self._is_admin = "*" in self._scope_set
+        self._wildcard_prefixes = frozenset(
+            s[:-2] for s in self._scope_set if s.endswith(":*")
+        )
+        # Cap concurrent dispatch within this handler (batch fan-out) so a
+        # large batch can't exhaust the DB pool or downstream API limits.
+        max_concurrency = getattr(settings, "MCP_MAX_CONCURRENCY", None)
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            max_concurrency = 16
+        self._concurrency = asyncio.Semaphore(max_concurrency)
+        # ToolContext is a pure function of (app.state, db, settings), none of
+        # which change within a handler's lifetime — build it once instead of
+        # per tools/call (which multiplies under batching).
+        self._ctx = self._create_tool_context()
     
     def _get_username(self) -> str:
         return self._token_info.created_by or self._token_info.name
@@ -149,12 +270,18 @@ class MCPHandler:
             details=details,
         )
     
-    async def handle(self, rpc_request: JSONRPCRequest) -> JSONRPCResponse:
-        """Route the request to the appropriate handler."""
+    async def handle(self, rpc_request: JSONRPCRequest) -> Optional[Dict[str, Any]]:
+        """Route the request to the appropriate handler.
+
+        Notifications (requests without an id) are executed for their side
+        effects but return None — JSON-RPC 2.0 forbids responding to them,
+        so the caller skips response serialization entirely.
+        """
         method = rpc_request.method
         params = rpc_request.params or {}
         request_id = rpc_request.id
-        
+        is_notification = request_id is None
+
         handlers = {
             "initialize": self._handle_initialize,
             "notifications/initialized": self._handle_initialized,
@@ -162,22 +289,35 @@ class MCPHandler:
             "tools/list": self._handle_tools_list,
             "tools/call": self._handle_tools_call,
         }
-        
+
         handler = handlers.get(method)
         if not handler:
+            if is_notification:
+                return None
             return make_error_response(
                 JSONRPC_METHOD_NOT_FOUND,
                 f"Method not found: {method}",
                 request_id=request_id
             )
-        
+
         try:
-            result = await handler(params)
+            async with self._concurrency:
+                result = await handler(params)
+            if is_notification:
+                return None
             return make_success_response(result, request_id=request_id)
         except MCPError as e:
+            if is_notification:
+                return None
             return make_error_response(e.code, e.message, e.data, request_id=request_id)
         except Exception as e:
-            logger.error(f"Error handling MCP method {method}: {e}", exc_info=True)
+            # %-style args and a DEBUG-gated traceback: a storm-calling client
+            # hitting a failing method shouldn't pay frame-walk formatting per
+            # error on the hot path.
+            logger.error("MCP method %s failed: %s", method, e)
+            logger.debug("Traceback:", exc_info=True)
+            if is_notification:
+                return None
             return make_error_response(
                 JSONRPC_INTERNAL_ERROR,
                 f"Internal error: {str(e)}",
@@ -218,23 +358,39 @@ class MCPHandler:
         return {}
     
     async def _handle_ping(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle ping request."""
-        return {"pong": True, "timestamp": datetime.now(timezone.utc).isoformat()}
+        """Handle ping request.
+
+        Agents hammer ping as a keepalive, so the ISO timestamp is cached at
+        1-second resolution (see _PING_TS) instead of being rebuilt per call.
+        """
+        now = int(time.time())
+        if now != _PING_TS[0]:
+            _PING_TS[0] = now
+            _PING_TS[1] = datetime.fromtimestamp(now, tz=timezone.utc).isoformat()
+        return {"pong": True, "timestamp": _PING_TS[1]}
     
     async def _handle_tools_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle tools/list request, filtering by token scopes."""
-        all_tools = self._tool_registry.get_mcp_definitions()
-        
-        # Filter tools by scope
-        filtered_tools = []
-        for tool_def in all_tools:
-            tool = self._tool_registry.get(tool_def["name"])
-            if tool:
-                required_scope = getattr(tool, "required_scope", "*")
-                if self._has_scope(required_scope):
-                    filtered_tools.append(tool_def)
-        
-        return {"tools": filtered_tools}
+        """Handle tools/list request, filtering by token scopes.
+
+        The filtered list is memoized per scope set (see _TOOLS_LIST_CACHE),
+        so repeat calls — MCP clients re-list on every reconnect — are a
+        dict lookup.
+        """
+        cache_key = frozenset(self._scope_set)
+        tools = _TOOLS_LIST_CACHE.get(cache_key)
+        if tools is None:
+            required_scopes = _get_tool_required_scopes()
+            tools = [
+                tool_def
+                for tool_def in _get_mcp_definitions()
+                if self._has_scope(required_scopes[tool_def["name"]])
+            ]
+            _TOOLS_LIST_CACHE[cache_key] = tools
+            while len(_TOOLS_LIST_CACHE) > _TOOLS_LIST_CACHE_MAX_SIZE:
+                _TOOLS_LIST_CACHE.popitem(last=False)
+        else:
+            _TOOLS_LIST_CACHE.move_to_end(cache_key)
+        return {"tools": tools}
     
     async def _handle_tools_call(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle tools/call request."""
@@ -269,9 +425,9 @@ class MCPHandler:
                 {"required_scope": required_scope, "token_scopes": self._token_info.scopes}
             )
         
-        # Create tool context
-        ctx = self._create_tool_context()
-        
+        # Shared tool context, built once in __init__
+        ctx = self._ctx
+
         # Execute the tool with audit logging
         success = False
         details_for_audit: Dict[str, Any] = {
@@ -290,7 +446,9 @@ class MCPHandler:
                     "content": [
                         {
                             "type": "text",
-                            "text": json.dumps(result.data, default=str)
+                            "text": orjson.dumps(
+                                result.data, default=str, option=_ORJSON_OPTS
+                            ).decode()
                         }
                     ],
                     "isError": False
@@ -308,7 +466,8 @@ class MCPHandler:
                 }
                 
         except Exception as e:
-            logger.error(f"Error executing tool {tool_name}: {e}", exc_info=True)
+            logger.error("Tool %s failed: %s", tool_name, e)
+            logger.debug("Traceback:", exc_info=True)
             details_for_audit["exception"] = {"type": type(e).__name__, "message": str(e)}
             return {
                 "content": [
@@ -322,28 +481,26 @@ class MCPHandler:
         finally:
             self._audit(action="TOOL_CALL", success=success, details=details_for_audit)
     
-    def _has_scope(self, required_scope: str) -> bool:
-        """Check if token has required scope."""
-        scopes = self._token_info.scopes
-        
-        # Admin wildcard
-        if "*" in scopes:
+    def _has_scope(self, required_scope: Optional[str]) -> bool:
+        """Check if token has required scope (admin wildcard, exact, or prefix wildcard)."""
+        # Tools with required_scope=None are available to any valid token
+        if not required_scope:
             return True
-        
-        # Exact match
-        if required_scope in scopes:
+
+        # Admin wildcard or exact match
+        if self._is_admin or required_scope in self._scope_set:
             return True
-        
-        # Prefix wildcard
-        if ":" in required_scope:
-            prefix = required_scope.split(":")[0]
-            if f"{prefix}:*" in scopes:
-                return True
-        
-        return False
+
+        # Prefix wildcard: "data-products:*" covers "data-products:read"
+        i = required_scope.find(":")
+        return i != -1 and required_scope[:i] in self._wildcard_prefixes
     
     def _create_tool_context(self) -> ToolContext:
-        """Create a ToolContext for tool execution."""
+        """Create the handler's ToolContext (called once from __init__).
+
+        If a per-call override is ever needed, dataclasses.replace(self._ctx,
+        ...) is cheaper than rebuilding from app.state.
+        """
         # Get managers from app.state if available
         app = self._request.app
         
@@ -368,16 +525,73 @@ class MCPError(Exception):
         super().__init__(message)
 
 
+def _get_cached_token(x_api_key: str) -> Optional[MCPTokenInfo]:
+    """Return a fresh cached validation for the key, evicting stale entries."""
+    cache_key = _token_cache_key(x_api_key)
+    with _TOKEN_CACHE_LOCK:
+        cached = _TOKEN_CACHE.get(cache_key)
+        if cached is None:
+            return None
+        cached_at, token_info = cached
+        if time.monotonic() - cached_at < _TOKEN_CACHE_TTL_SECONDS:
+            _TOKEN_CACHE.move_to_end(cache_key)
+            return token_info
+        _TOKEN_CACHE.pop(cache_key, None)
+        return None
+
+
 def validate_api_key(
     db: Session,
     x_api_key: Optional[str]
 ) -> Optional[MCPTokenInfo]:
-    """Validate the API key and return token info if valid."""
+    """
+    Validate the API key and return token info if valid.
+
+    Successful validations are cached for a short TTL (see _TOKEN_CACHE) so
+    repeated calls with the same key skip the DB lookup and bcrypt compares.
+
+    This does blocking DB/bcrypt work — async endpoints should go through
+    validate_api_key_async instead of calling it on the event loop.
+    """
     if not x_api_key:
         return None
-    
+
+    token_info = _get_cached_token(x_api_key)
+    if token_info is not None:
+        return token_info
+
     token_manager = MCPTokensManager(db=db)
-    return token_manager.validate_token(x_api_key)
+    token_info = token_manager.validate_token(x_api_key)
+
+    if token_info is not None:
+        with _TOKEN_CACHE_LOCK:
+            _TOKEN_CACHE[_token_cache_key(x_api_key)] = (time.monotonic(), token_info)
+            # LRU eviction: drop the least recently used entry when over capacity
+            while len(_TOKEN_CACHE) > _TOKEN_CACHE_MAX_SIZE:
+                _TOKEN_CACHE.popitem(last=False)
+
+    return token_info
+
+
+async def validate_api_key_async(
+    db: Session,
+    x_api_key: Optional[str]
+) -> Optional[MCPTokenInfo]:
+    """
+    Event-loop-safe wrapper around validate_api_key.
+
+    Cache hits are answered inline (a dict lookup isn't worth a threadpool
+    hop); misses run the blocking DB query + bcrypt compares in Starlette's
+    threadpool so concurrent requests aren't stalled behind them.
+    """
+    if not x_api_key:
+        return None
+
+    token_info = _get_cached_token(x_api_key)
+    if token_info is not None:
+        return token_info
+
+    return await run_in_threadpool(validate_api_key, db, x_api_key)
 
 
 async def sse_event_generator(
@@ -457,7 +671,7 @@ async def mcp_sse_stream(
         )
     
     # Validate API key
-    token_info = validate_api_key(db, x_api_key)
+    token_info = await validate_api_key_async(db, x_api_key)
     if not token_info:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -492,6 +706,88 @@ async def mcp_sse_stream(
     )
 
 
+async def _handle_batch(
+    body: List[Any],
+    db: Session,
+    settings: Settings,
+    token_info: MCPTokenInfo,
+    request: Request,
+    audit_manager: AuditManager,
+    session_id: Optional[str],
+) -> Response:
+    """
+    Process a JSON-RPC 2.0 batch request.
+
+    All entries share one MCPHandler (token info, registry) and are dispatched
+    concurrently with asyncio.gather so I/O-bound tools overlap. Responses to
+    notifications (requests without an id) are omitted per the JSON-RPC spec;
+    if every entry was a notification the reply is an empty 204. The DB is
+    committed once after the whole batch. Batch replies are always plain JSON
+    (the streamable-HTTP transport lets the server choose the response format).
+    """
+    if not body:
+        return ORJSONResponse(
+            content=make_error_response(JSONRPC_INVALID_REQUEST, "Invalid request: empty batch")
+        )
+
+    if session_id and session_id not in _sessions:
+        return ORJSONResponse(
+            content=make_error_response(JSONRPC_INVALID_REQUEST, "Session not found")
+        )
+
+    logger.info(f"MCP batch request: size={len(body)}, token={token_info.name}")
+
+    handler = MCPHandler(db, settings, token_info, request, audit_manager, session_id)
+
+    rpc_requests: List[JSONRPCRequest] = []
+    responses: List[Dict[str, Any]] = []
+    for item in body:
+        try:
+            rpc_requests.append(JSONRPCRequest(**item))
+        except Exception as e:
+            responses.append(
+                make_error_response(JSONRPC_INVALID_REQUEST, f"Invalid request: {str(e)}")
+            )
+
+    # Concurrent dispatch, capped by the handler's semaphore. The shared sync
+    # Session is safe here: sync DB work inside the coroutines never yields,
+    # so it can't actually interleave on the event loop. return_exceptions
+    # keeps one pathological entry (e.g. CancelledError escaping handle())
+    # from tearing down the whole batch.
+    results = await asyncio.gather(
+        *(handler.handle(r) for r in rpc_requests), return_exceptions=True
+    )
+
+    # Notifications (no id) get no response entry, per JSON-RPC 2.0.
+    for req, result in zip(rpc_requests, results):
+        if isinstance(result, BaseException):
+            logger.error("MCP batch entry %s failed: %s", req.method, result)
+            if req.id is not None:
+                responses.append(
+                    make_error_response(
+                        JSONRPC_INTERNAL_ERROR,
+                        f"Internal error: {str(result)}",
+                        request_id=req.id,
+                    )
+                )
+        elif req.id is not None:
+            responses.append(result)
+
+    # Commit once after the whole batch, off the event loop
+    try:
+        await run_in_threadpool(db.commit)
+    except Exception as e:
+        logger.error("Error committing MCP batch changes: %s", e)
+        logger.debug("Traceback:", exc_info=True)
+        db.rollback()
+
+    if not responses:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    response_headers = {"MCP-Session-Id": session_id} if session_id else {}
+    return ORJSONResponse(content=responses, headers=response_headers)
+
+
 @router.post("")
 async def mcp_handler(
     request: Request,
@@ -507,7 +803,10 @@ async def mcp_handler(
     
     Requires X-API-Key header with a valid MCP token.
     Supports methods: initialize, notifications/initialized, ping, tools/list, tools/call
-    
+
+    Accepts either a single JSON-RPC request object or a batch (JSON array of
+    request objects, answered with a JSON array of responses).
+
     Response format depends on Accept header:
     - Accept: text/event-stream -> SSE stream response
     - Accept: application/json (or default) -> JSON response
@@ -517,20 +816,17 @@ async def mcp_handler(
     
     # Helper to create error response in the appropriate format
     async def error_response(code: int, message: str, request_id: Any = None):
-        response_data = JSONRPCResponse(
-            error=JSONRPCError(code=code, message=message),
-            id=request_id
-        ).model_dump()
-        
+        response_data = make_error_response(code, message, request_id=request_id)
+
         if use_sse:
             return EventSourceResponse(
                 sse_event_generator(response_data, session_id),
                 headers={"MCP-Session-Id": session_id} if session_id else {}
             )
-        return JSONResponse(content=response_data)
+        return ORJSONResponse(content=response_data)
     
     # Validate API key
-    token_info = validate_api_key(db, x_api_key)
+    token_info = await validate_api_key_async(db, x_api_key)
     if not token_info:
         audit_manager.log_action(
             db=db,
@@ -543,12 +839,22 @@ async def mcp_handler(
         )
         return await error_response(MCP_AUTH_FAILED, "Invalid or missing API key")
     
-    # Parse request body
+    # Parse request body with orjson: C-speed parse of the raw bytes instead
+    # of Starlette's stdlib-json path — a single pass even for large batch or
+    # tools/call argument payloads.
     try:
-        body = await request.json()
-    except Exception as e:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
         return await error_response(JSONRPC_PARSE_ERROR, f"Failed to parse JSON: {str(e)}")
-    
+
+    # JSON-RPC 2.0 batch: an array of request objects, answered with an array
+    # of responses. All entries share one authenticated handler so auth and
+    # registry setup are paid once per HTTP round-trip instead of per call.
+    if isinstance(body, list):
+        return await _handle_batch(
+            body, db, settings, token_info, request, audit_manager, session_id
+        )
+
     # Validate JSON-RPC format
     try:
         rpc_request = JSONRPCRequest(**body)
@@ -581,30 +887,33 @@ async def mcp_handler(
     
     # Handle the request
     handler = MCPHandler(db, settings, token_info, request, audit_manager, session_id)
-    response = await handler.handle(rpc_request)
-    
-    # Commit any changes
+    response_data = await handler.handle(rpc_request)
+
+    # Commit any changes (blocking sync I/O goes to the threadpool)
     try:
-        db.commit()
+        await run_in_threadpool(db.commit)
     except Exception as e:
-        logger.error(f"Error committing MCP changes: {e}")
+        logger.error("Error committing MCP changes: %s", e)
+        logger.debug("Traceback:", exc_info=True)
         db.rollback()
-    
-    response_data = response.model_dump()
-    
+
     # Build response headers
     response_headers = {}
     if session_id:
         response_headers["MCP-Session-Id"] = session_id
-    
+
+    # Notifications get no response body, per JSON-RPC 2.0
+    if response_data is None:
+        return Response(status_code=status.HTTP_204_NO_CONTENT, headers=response_headers)
+
     # Return in appropriate format
     if use_sse:
         return EventSourceResponse(
             sse_event_generator(response_data, session_id),
             headers=response_headers
         )
-    
-    return JSONResponse(content=response_data, headers=response_headers)
+
+    return ORJSONResponse(content=response_data, headers=response_headers)
 
 
 @router.delete("")
@@ -621,7 +930,7 @@ async def mcp_delete_session(
     Clients should call this when they no longer need the session.
     """
     # Validate API key
-    token_info = validate_api_key(db, x_api_key)
+    token_info = await validate_api_key_async(db, x_api_key)
     if not token_info:
         audit_manager.log_action(
             db=db,
@@ -9,6 +9,7 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
 
 from src.common.authorization import require_ontos_admin
 from src.common.dependencies import CurrentUserDep, DBSessionDep, AuditManagerDep, AuditCurrentUserDep
@@ -20,6 +21,7 @@ from src.models.mcp_tokens import (
     MCPTokenList,
     MCPTokenResponse,
 )
+from src.routes.mcp_routes import invalidate_token_cache
 
 logger = get_logger(__name__)
 
@@ -117,27 +119,32 @@ async def list_mcp_tokens(
 ):
     """List all MCP API tokens."""
     logger.debug(f"Listing MCP tokens (include_inactive={include_inactive})")
-    
+
     manager = MCPTokensManager(db=db)
-    
+
     tokens = manager.list_tokens(include_inactive=include_inactive)
-    
-    token_infos = [
-        MCPTokenInfo(
-            id=t.id,
-            name=t.name,
-            scopes=t.scopes or [],
-            created_by=t.created_by,
-            created_at=t.created_at,
-            last_used_at=t.last_used_at,
-            expires_at=t.expires_at,
-            is_active=t.is_active,
-            is_expired=t.is_expired
-        )
-        for t in tokens
-    ]
-    
-    return MCPTokenList(tokens=token_infos, total=len(token_infos))
+
+    # Build the payload as plain dicts and return an ORJSONResponse directly:
+    # returning a Response instance skips FastAPI's response_model
+    # re-validation (one Pydantic walk per row) while keeping MCPTokenList in
+    # the OpenAPI docs. orjson encodes UUIDs and datetimes natively.
+    return ORJSONResponse(content={
+        "tokens": [
+            {
+                "id": t.id,
+                "name": t.name,
+                "scopes": t.scopes or [],
+                "created_by": t.created_by,
+                "created_at": t.created_at,
+                "last_used_at": t.last_used_at,
+                "expires_at": t.expires_at,
+                "is_active": t.is_active,
+                "is_expired": t.is_expired,
+            }
+            for t in tokens
+        ],
+        "total": len(tokens),
+    })
 
 
 @router.get(
@@ -191,22 +198,22 @@ async def revoke_mcp_token(
 ):
     """Revoke an MCP API token."""
     logger.info(f"Revoking MCP token: id={token_id}")
-    
+
     manager = MCPTokensManager(db=db)
-    
-    # Get token info before revoking for audit
-    token = manager.get_token(token_id)
-    token_name = token.name if token else 'unknown'
-    
-    success = manager.revoke_token(token_id)
-    
-    if not success:
+
+    # Single UPDATE .. RETURNING: existence check and audit name in one round-trip
+    token_name = manager.revoke_token(token_id)
+
+    if token_name is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Token {token_id} not found"
         )
-    
+
     db.commit()
+
+    # Revoked tokens must stop working immediately, not at cache TTL expiry
+    invalidate_token_cache()
     
     audit_manager.log_action(
         db=db,
@@ -237,22 +244,22 @@ async def delete_mcp_token(
 ):
     """Permanently delete an MCP API token."""
     logger.info(f"Deleting MCP token: id={token_id}")
-    
+
     manager = MCPTokensManager(db=db)
-    
-    # Get token info before deleting for audit
-    token = manager.get_token(token_id)
-    token_name = token.name if token else 'unknown'
-    
-    success = manager.delete_token(token_id)
-    
-    if not success:
+
+    # Single DELETE .. RETURNING: existence check and audit name in one round-trip
+    token_name = manager.delete_token(token_id)
+
+    if token_name is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Token {token_id} not found"
         )
-    
+
     db.commit()
+
+    # Deleted tokens must stop working immediately, not at cache TTL expiry
+    invalidate_token_cache()
     
     audit_manager.log_action(
         db=db,
@@ -0,0 +1,274 @@
+"""Unit tests for JSON-RPC 2.0 batch handling in the MCP endpoint.
+
+Exercises ``_handle_batch`` directly (not through the HTTP stack) so we
+can cover the batch semantics without standing up auth: one shared
+``MCPHandler`` per batch, one response per request with ids preserved,
+notification responses omitted per the JSON-RPC spec, an all-notification
+batch collapsing to HTTP 204, and malformed entries answered with
+per-entry invalid-request errors instead of failing the whole batch.
+"""
+
+# Set test environment variables BEFORE any app imports
+import os
+os.environ['TESTING'] = 'true'
+os.environ['SKIP_STARTUP_TASKS'] = 'true'
+
+import json
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.controller.mcp_tokens_manager import MCPTokenInfo
+from src.routes.mcp_routes import (
+    JSONRPC_INVALID_REQUEST,
+    _handle_batch,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_token_info(scopes=None) -> MCPTokenInfo:
+    return MCPTokenInfo(
+        id=uuid.uuid4(),
+        name="test-token",
+        scopes=scopes if scopes is not None else ["*"],
+        created_by="tester@example.com",
+        created_at=datetime.now(timezone.utc),
+        expires_at=None,
+    )
+
+
+def _make_request() -> MagicMock:
+    request = MagicMock()
+    request.client.host = "127.0.0.1"
+    return request
+
+
+async def _run_batch(body, session_id=None):
+    return await _handle_batch(
+        body=body,
+        db=MagicMock(),
+        settings=MagicMock(),
+        token_info=_make_token_info(),
+        request=_make_request(),
+        audit_manager=None,
+        session_id=session_id,
+    )
+
+
+def _parse(response):
+    return json.loads(response.body)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_one_response_per_request_with_ids():
+    body = [
+        {"jsonrpc": "2.0", "method": "ping", "id": 1},
+        {"jsonrpc": "2.0", "method": "ping", "id": "abc"},
+    ]
+    response = await _run_batch(body)
+
+    assert response.status_code == 200
+    payload = _parse(response)
+    assert isinstance(payload, list)
+    assert [r["id"] for r in payload] == [1, "abc"]
+    assert all(r["result"]["pong"] is True for r in payload)
+
+
+@pytest.mark.asyncio
+async def test_batch_omits_notification_responses():
+    body = [
+        {"jsonrpc": "2.0", "method": "ping", "id": 7},
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+    ]
+    response = await _run_batch(body)
+
+    payload = _parse(response)
+    assert len(payload) == 1
+    assert payload[0]["id"] == 7
+
+
+@pytest.mark.asyncio
+async def test_batch_of_only_notifications_returns_204():
+    body = [
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+    ]
+    response = await _run_batch(body)
+
+    assert response.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_empty_batch_is_invalid_request():
+    response = await _run_batch([])
+
+    payload = _parse(response)
+    assert payload["error"]["code"] == JSONRPC_INVALID_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_malformed_entry_gets_error_without_failing_batch():
+    body = [
+        {"jsonrpc": "2.0", "id": 1},  # missing method
+        {"jsonrpc": "2.0", "method": "ping", "id": 2},
+    ]
+    response = await _run_batch(body)
+
+    payload = _parse(response)
+    assert len(payload) == 2
+    error_entries = [r for r in payload if r.get("error")]
+    ok_entries = [r for r in payload if r.get("result")]
+    assert len(error_entries) == 1
+    assert error_entries[0]["error"]["code"] == JSONRPC_INVALID_REQUEST
+    assert len(ok_entries) == 1
+    assert ok_entries[0]["id"] == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_session_rejects_batch():
+    body = [{"jsonrpc": "2.0", "method": "ping", "id": 1}]
+    response = await _run_batch(body, session_id="no-such-session")
+
+    payload = _parse(response)
+    assert payload["error"]["code"] == JSONRPC_INVALID_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_batch_commits_db_once():
+    db = MagicMock()
+    await _handle_batch(
+        body=[
+            {"jsonrpc": "2.0", "method": "ping", "id": 1},
+            {"jsonrpc": "2.0", "method": "ping", "id": 2},
+        ],
+        db=db,
+        settings=MagicMock(),
+        token_info=_make_token_info(),
+        request=_make_request(),
+        audit_manager=None,
+        session_id=None,
+    )
+
+    assert db.commit.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_responses_omit_unset_result_and_error_fields():
+    body = [
+        {"jsonrpc": "2.0", "method": "ping", "id": 1},
+        {"jsonrpc": "2.0", "method": "no/such/method", "id": 2},
+    ]
+    response = await _run_batch(body)
+
+    payload = _parse(response)
+    success = next(r for r in payload if r["id"] == 1)
+    error = next(r for r in payload if r["id"] == 2)
+    assert "error" not in success
+    assert "result" not in error
+
+
+@pytest.mark.asyncio
+async def test_exception_escaping_handle_maps_to_internal_error(monkeypatch):
+    from src.routes.mcp_routes import JSONRPC_INTERNAL_ERROR, MCPHandler
+
+    async def boom(self, rpc_request):
+        raise RuntimeError("dispatch blew up")
+
+    monkeypatch.setattr(MCPHandler, "handle", boom)
+
+    response = await _run_batch([
+        {"jsonrpc": "2.0", "method": "ping", "id": 1},
+    ])
+
+    payload = _parse(response)
+    assert payload[0]["id"] == 1
+    assert payload[0]["error"]["code"] == JSONRPC_INTERNAL_ERROR
+
+
+@pytest.mark.asyncio
+async def test_batch_dispatch_is_capped_by_semaphore(monkeypatch):
+    import asyncio
+
+    from src.routes.mcp_routes import MCPHandler
+
+    running = {"now": 0, "peak": 0}
+
+    async def tracked_ping(self, params):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(0)
+        running["now"] -= 1
+        return {"pong": True}
+
+    monkeypatch.setattr(MCPHandler, "_handle_ping", tracked_ping)
+
+    settings = MagicMock()
+    settings.MCP_MAX_CONCURRENCY = 2
+    await _handle_batch(
+        body=[{"jsonrpc": "2.0", "method": "ping", "id": i} for i in range(8)],
+        db=MagicMock(),
+        settings=settings,
+        token_info=_make_token_info(),
+        request=_make_request(),
+        audit_manager=None,
+        session_id=None,
+    )
+
+    assert running["peak"] <= 2
+
+
+# ---------------------------------------------------------------------------
+# Notification semantics (single-request dispatch)
+# ---------------------------------------------------------------------------
+
+
+def _make_handler():
+    from src.routes.mcp_routes import MCPHandler
+
+    return MCPHandler(
+        db=MagicMock(),
+        settings=MagicMock(),
+        token_info=_make_token_info(),
+        request=_make_request(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_notification_returns_no_response():
+    from src.models.mcp import JSONRPCRequest
+
+    result = await _make_handler().handle(
+        JSONRPCRequest(method="notifications/initialized")
+    )
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_unknown_method_notification_is_silently_ignored():
+    from src.models.mcp import JSONRPCRequest
+
+    result = await _make_handler().handle(JSONRPCRequest(method="no/such/method"))
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_unknown_method_with_id_still_gets_error():
+    from src.models.mcp import JSONRPCRequest
+    from src.routes.mcp_routes import JSONRPC_METHOD_NOT_FOUND
+
+    result = await _make_handler().handle(
+        JSONRPCRequest(method="no/such/method", id=5)
+    )
+    assert result["error"]["code"] == JSONRPC_METHOD_NOT_FOUND
+    assert result["id"] == 5
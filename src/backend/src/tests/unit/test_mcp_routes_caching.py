@@ -0,0 +1,273 @@
+"""Unit tests for the process-wide caches used by the MCP endpoint.
+
+Two caches under test:
+
+1. The tool registry (and everything derived from it — MCP definitions,
+   required-scope map) is immutable for the process lifetime, so the
+   route module memoizes it instead of rebuilding per request. Handlers
+   must share one registry instance, the derived maps must agree with
+   the registry, and scope filtering in ``tools/list`` must still work
+   against the cached definitions.
+2. ``validate_api_key`` caches successful token validations for a short
+   TTL so repeat calls skip the DB round-trip and bcrypt compares.
+   Hits must not re-validate, expired entries must, failures must never
+   be cached, and ``invalidate_token_cache`` (called by the revoke /
+   delete routes) must force immediate re-validation.
+"""
+
+# Set test environment variables BEFORE any app imports
+import os
+os.environ['TESTING'] = 'true'
+os.environ['SKIP_STARTUP_TASKS'] = 'true'
+
+import time
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.controller.mcp_tokens_manager import MCPTokenInfo
+from src.routes.mcp_routes import (
+    MCPHandler,
+    _get_mcp_definitions,
+    _get_registry,
+    _get_tool_required_scopes,
+    _TOOLS_LIST_CACHE,
+    invalidate_registry_caches,
+    invalidate_token_cache,
+    validate_api_key,
+)
+
+
+def _make_token_info(scopes) -> MCPTokenInfo:
+    return MCPTokenInfo(
+        id=uuid.uuid4(),
+        name="test-token",
+        scopes=scopes,
+        created_by="tester@example.com",
+        created_at=datetime.now(timezone.utc),
+        expires_at=None,
+    )
+
+
+def _make_handler(scopes) -> MCPHandler:
+    token_info = _make_token_info(scopes)
+    return MCPHandler(
+        db=MagicMock(),
+        settings=MagicMock(),
+        token_info=token_info,
+        request=MagicMock(),
+    )
+
+
+def test_registry_is_shared_across_handlers():
+    handler_a = _make_handler(scopes=["*"])
+    handler_b = _make_handler(scopes=["*"])
+    assert handler_a._tool_registry is handler_b._tool_registry
+    assert handler_a._tool_registry is _get_registry()
+
+
+def test_required_scope_map_matches_registry():
+    registry = _get_registry()
+    required_scopes = _get_tool_required_scopes()
+
+    definitions = _get_mcp_definitions()
+    assert {d["name"] for d in definitions} == set(required_scopes)
+    for name, scope in required_scopes.items():
+        assert scope == getattr(registry.get(name), "required_scope", "*")
+
+
+@pytest.mark.asyncio
+async def test_tools_list_admin_sees_all_tools():
+    handler = _make_handler(scopes=["*"])
+    result = await handler._handle_tools_list({})
+    assert len(result["tools"]) == len(_get_mcp_definitions())
+
+
+@pytest.mark.asyncio
+async def test_tools_list_filters_by_scope():
+    required_scopes = _get_tool_required_scopes()
+    # Pick a real scope from the registry so the test doesn't depend on
+    # any specific tool naming.
+    scoped = [s for s in required_scopes.values() if s not in (None, "*")]
+    assert scoped, "registry should contain at least one scoped tool"
+    scope = scoped[0]
+
+    handler = _make_handler(scopes=[scope])
+    result = await handler._handle_tools_list({})
+    listed = {t["name"] for t in result["tools"]}
+
+    # Tools with required_scope=None are visible to any valid token.
+    expected = {
+        name
+        for name, required in required_scopes.items()
+        if required == scope or required is None
+    }
+    assert listed == expected
+
+
+# ---------------------------------------------------------------------------
+# Token validation cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def _clear_token_cache():
+    """Isolate each test from entries cached by its neighbors."""
+    invalidate_token_cache()
+    yield
+    invalidate_token_cache()
+
+
+def _patch_validate(monkeypatch, token_info):
+    """Replace MCPTokensManager.validate_token, counting invocations."""
+    calls = {"count": 0}
+
+    def fake_validate(self, token):
+        calls["count"] += 1
+        return token_info
+
+    monkeypatch.setattr(
+        "src.routes.mcp_routes.MCPTokensManager.validate_token", fake_validate
+    )
+    return calls
+
+
+def test_validate_api_key_caches_successful_validation(monkeypatch):
+    calls = _patch_validate(monkeypatch, _make_token_info(["*"]))
+
+    first = validate_api_key(MagicMock(), "mcp_test-key")
+    second = validate_api_key(MagicMock(), "mcp_test-key")
+
+    assert first is second
+    assert calls["count"] == 1
+
+
+def test_validate_api_key_does_not_cache_failures(monkeypatch):
+    calls = _patch_validate(monkeypatch, None)
+
+    assert validate_api_key(MagicMock(), "mcp_bad-key") is None
+    assert validate_api_key(MagicMock(), "mcp_bad-key") is None
+    assert calls["count"] == 2
+
+
+def test_validate_api_key_revalidates_after_ttl(monkeypatch):
+    calls = _patch_validate(monkeypatch, _make_token_info(["*"]))
+
+    now = time.monotonic()
+    validate_api_key(MagicMock(), "mcp_test-key")
+    monkeypatch.setattr(
+        "src.routes.mcp_routes.time.monotonic", lambda: now + 3600
+    )
+    validate_api_key(MagicMock(), "mcp_test-key")
+
+    assert calls["count"] == 2
+
+
+def test_invalidate_token_cache_forces_revalidation(monkeypatch):
+    calls = _patch_validate(monkeypatch, _make_token_info(["*"]))
+
+    validate_api_key(MagicMock(), "mcp_test-key")
+    invalidate_token_cache()
+    validate_api_key(MagicMock(), "mcp_test-key")
+
+    assert calls["count"] == 2
+
+
+# ---------------------------------------------------------------------------
+# Scope matching
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "token_scopes,required,expected",
+    [
+        (["*"], "data-products:write", True),
+        (["data-products:read"], "data-products:read", True),
+        (["data-products:read"], "data-products:write", False),
+        (["data-products:*"], "data-products:write", True),
+        (["data-products:*"], "data-contracts:read", False),
+        (["data-products:read"], "unscoped", False),
+        ([], None, True),  # required_scope=None means publicly available
+        ([], "data-products:read", False),
+    ],
+)
+def test_has_scope_matching(token_scopes, required, expected):
+    handler = _make_handler(scopes=token_scopes)
+    assert handler._has_scope(required) is expected
+
+
+# ---------------------------------------------------------------------------
+# Ping timestamp cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_ping_timestamp_cached_within_one_second(monkeypatch):
+    handler = _make_handler(scopes=["*"])
+
+    monkeypatch.setattr("src.routes.mcp_routes.time.time", lambda: 1_700_000_000.2)
+    first = await handler._handle_ping({})
+    monkeypatch.setattr("src.routes.mcp_routes.time.time", lambda: 1_700_000_000.9)
+    second = await handler._handle_ping({})
+
+    assert first["pong"] is True
+    assert first["timestamp"] is second["timestamp"]
+
+
+@pytest.mark.asyncio
+async def test_ping_timestamp_advances_across_seconds(monkeypatch):
+    handler = _make_handler(scopes=["*"])
+
+    monkeypatch.setattr("src.routes.mcp_routes.time.time", lambda: 1_700_000_000.5)
+    first = await handler._handle_ping({})
+    monkeypatch.setattr("src.routes.mcp_routes.time.time", lambda: 1_700_000_001.5)
+    second = await handler._handle_ping({})
+
+    assert first["timestamp"] != second["timestamp"]
+    # Timestamps stay timezone-aware ISO-8601
+    assert second["timestamp"].endswith("+00:00")
+
+
+# ---------------------------------------------------------------------------
+# tools/list per-scope-set cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def _clear_tools_list_cache():
+    """Isolate each test from tools/list entries cached by its neighbors."""
+    _TOOLS_LIST_CACHE.clear()
+    yield
+    _TOOLS_LIST_CACHE.clear()
+
+
+@pytest.mark.asyncio
+async def test_tools_list_cached_per_scope_set():
+    handler_a = _make_handler(scopes=["data-products:read"])
+    handler_b = _make_handler(scopes=["data-products:read"])
+
+    first = await handler_a._handle_tools_list({})
+    second = await handler_b._handle_tools_list({})
+
+    # Same scope set -> the prebuilt list object itself is reused
+    assert first["tools"] is second["tools"]
+
+
+@pytest.mark.asyncio
+async def test_tools_list_cache_distinguishes_scope_sets():
+    admin = await _make_handler(scopes=["*"])._handle_tools_list({})
+    scoped = await _make_handler(scopes=["data-products:read"])._handle_tools_list({})
+
+    assert len(_TOOLS_LIST_CACHE) == 2
+    assert len(admin["tools"]) > len(scoped["tools"])
+
+
+@pytest.mark.asyncio
+async def test_invalidate_registry_caches_clears_tools_list():
+    await _make_handler(scopes=["*"])._handle_tools_list({})
+    assert _TOOLS_LIST_CACHE
+
+    invalidate_registry_caches()
+    assert not _TOOLS_LIST_CACHE
@@ -0,0 +1,58 @@
+"""
+Unit tests for MCPTokensRepository
+
+Focuses on the fused revoke/delete paths: both run a single
+UPDATE/DELETE .. RETURNING statement and hand back the token name (for
+audit logging) instead of requiring a SELECT-then-mutate pair. Covers
+the existence semantics that fall out of that: revoking an already
+revoked token or touching a missing id returns None.
+"""
+import uuid
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.db_models.mcp_tokens import MCPTokenDb
+from src.repositories.mcp_tokens_repository import mcp_tokens_repo
+
+
+@pytest.fixture
+def token(db_session: Session) -> MCPTokenDb:
+    """A persisted active token."""
+    return mcp_tokens_repo.create(
+        db=db_session,
+        name="Test Token",
+        token_hash=f"hash-{uuid.uuid4()}",
+        scopes=["data-products:read"],
+        created_by="tester@example.com",
+    )
+
+
+class TestRevoke:
+
+    def test_revoke_active_token_returns_name(self, db_session: Session, token):
+        assert mcp_tokens_repo.revoke(db_session, token.id) == "Test Token"
+
+        db_session.expire_all()
+        assert mcp_tokens_repo.get_by_id(db_session, token.id).is_active is False
+
+    def test_revoke_already_revoked_token_returns_none(self, db_session: Session, token):
+        mcp_tokens_repo.revoke(db_session, token.id)
+        assert mcp_tokens_repo.revoke(db_session, token.id) is None
+
+    def test_revoke_missing_token_returns_none(self, db_session: Session):
+        assert mcp_tokens_repo.revoke(db_session, uuid.uuid4()) is None
+
+
+class TestDelete:
+
+    def test_delete_token_returns_name(self, db_session: Session, token):
+        assert mcp_tokens_repo.delete(db_session, token.id) == "Test Token"
+        assert mcp_tokens_repo.get_by_id(db_session, token.id) is None
+
+    def test_delete_missing_token_returns_none(self, db_session: Session):
+        assert mcp_tokens_repo.delete(db_session, uuid.uuid4()) is None
+
+    def test_delete_works_on_revoked_token(self, db_session: Session, token):
+        mcp_tokens_repo.revoke(db_session, token.id)
+        assert mcp_tokens_repo.delete(db_session, token.id) == "Test Token"